@@ -294,7 +294,7 @@ class DeploymentInfo:
     @classmethod
     def from_proto(cls, proto: DeploymentInfoProto):
         deployment_config = (
-            DeploymentConfig.from_proto(proto.deployment_config)
+            DeploymentConfig.from_proto(proto.deployment_config, validate=False)
             if proto.deployment_config
             else None
         )
@@ -443,9 +443,14 @@ class ActorReplicaWrapper:
 
         # Perform auto method name translation for java handles.
         # See https://github.com/ray-project/ray/issues/21474
-        deployment_config = copy(self._version.deployment_config)
-        deployment_config.user_config = self._format_user_config(
-            deployment_config.user_config
+        # The config was already validated, so use copy(update=...) to avoid
+        # re-running validators on assignment.
+        deployment_config = self._version.deployment_config.copy(
+            update={
+                "user_config": self._format_user_config(
+                    self._version.deployment_config.user_config
+                )
+            }
         )
         if self._is_cross_language:
             self._actor_handle = JavaActorHandleProxy(self._actor_handle)
@@ -488,9 +493,12 @@ class ActorReplicaWrapper:
             # Call into replica actor reconfigure() with updated user config and
             # graceful_shutdown_wait_loop_s
             updating = True
-            deployment_config = copy(version.deployment_config)
-            deployment_config.user_config = self._format_user_config(
-                deployment_config.user_config
+            deployment_config = version.deployment_config.copy(
+                update={
+                    "user_config": self._format_user_config(
+                        version.deployment_config.user_config
+                    )
+                }
             )
             self._ready_obj_ref = self._actor_handle.reconfigure.remote(
                 deployment_config
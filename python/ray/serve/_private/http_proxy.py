@@ -7,7 +7,7 @@ import logging
 import pickle
 import socket
 import time
-from typing import Callable, Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any
 import uuid
 
 import uvicorn
@@ -1065,7 +1065,7 @@ class HTTPProxyActor:
         node_ip_address: str,
         node_id: NodeId,
         request_timeout_s: Optional[float] = None,
-        http_middlewares: Optional[List["starlette.middleware.Middleware"]] = None,
+        http_middlewares: Optional[Sequence["starlette.middleware.Middleware"]] = None,
         keep_alive_timeout_s: int = DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
     ):  # noqa: F821
         configure_component_logger(
@@ -1086,7 +1086,7 @@ class HTTPProxyActor:
         if http_middlewares is None:
             http_middlewares = [Middleware(RequestIdMiddleware)]
         else:
-            http_middlewares.append(Middleware(RequestIdMiddleware))
+            http_middlewares = [*http_middlewares, Middleware(RequestIdMiddleware)]
 
         if RAY_SERVE_HTTP_PROXY_CALLBACK_IMPORT_PATH:
             logger.info(
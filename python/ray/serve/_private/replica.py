@@ -139,8 +139,9 @@ def create_replica_wrapper(name: str):
             init_args = cloudpickle.loads(serialized_init_args)
             init_kwargs = cloudpickle.loads(serialized_init_kwargs)
 
+            # The controller serializes an already-validated config.
             deployment_config = DeploymentConfig.from_proto_bytes(
-                deployment_config_proto_bytes
+                deployment_config_proto_bytes, validate=False
             )
 
             if inspect.isfunction(deployment_def):
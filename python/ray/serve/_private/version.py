@@ -135,7 +135,7 @@ class DeploymentVersion:
     def from_proto(cls, proto: DeploymentVersionProto):
         return DeploymentVersion(
             proto.code_version,
-            DeploymentConfig.from_proto(proto.deployment_config),
+            DeploymentConfig.from_proto(proto.deployment_config, validate=False),
             json.loads(proto.ray_actor_options),
             placement_group_bundles=(
                 json.loads(proto.placement_group_bundles)
@@ -2,10 +2,10 @@ import inspect
 import json
 import logging
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Set
 
 import pydantic
-from google.protobuf.json_format import MessageToDict
 from pydantic import (
     BaseModel,
     NonNegativeFloat,
@@ -43,8 +43,29 @@ from ray._private.utils import import_attr, resources_from_ray_options
 from ray._private.serialization import pickle_dumps
 from ray.util.annotations import DeveloperAPI, PublicAPI
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
+# Please keep this in sync with the docstring for the ray_actor_options
+# kwarg in api.py.
+_ALLOWED_RAY_ACTOR_OPTIONS = frozenset(
+    {
+        # Resource options
+        "accelerator_type",
+        "memory",
+        "num_cpus",
+        "num_gpus",
+        "object_store_memory",
+        "resources",
+        # Other options
+        "runtime_env",
+    }
+)
+
 
 @PublicAPI(stability="stable")
 class AutoscalingConfig(BaseModel):
@@ -110,6 +131,31 @@ class AutoscalingConfig(BaseModel):
     # TODO(architkulkarni): Add reasonable defaults
 
 
+def _json_dumps(obj: Any) -> str:
+    """Encode obj as JSON, using orjson when it's installed.
+
+    Falls back to the standard library for inputs orjson rejects (e.g.,
+    non-string dict keys) so the accepted inputs match json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def _json_loads(s: str) -> Any:
+    """Decode a JSON string, using orjson when it's installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except ValueError:
+            pass
+    return json.loads(s)
+
+
+@lru_cache(maxsize=4)
 def _needs_pickle(deployment_language: DeploymentLanguage, is_cross_language: bool):
     """From Serve client API's perspective, decide whether pickling is needed."""
     if deployment_language == DeploymentLanguage.PYTHON and not is_cross_language:
@@ -216,13 +262,15 @@ class DeploymentConfig(BaseModel):
 
     @validator("user_config", always=True)
     def user_config_json_serializable(cls, v):
-        if isinstance(v, bytes):
+        # bytes are passed through as-is, and JSON scalars are always
+        # serializable, so only encode containers and other objects.
+        if v is None or isinstance(v, (bytes, str, int, float)):
             return v
-        if v is not None:
-            try:
-                json.dumps(v)
-            except TypeError as e:
-                raise ValueError(f"user_config is not JSON-serializable: {str(e)}.")
+
+        try:
+            json.dumps(v)
+        except TypeError as e:
+            raise ValueError(f"user_config is not JSON-serializable: {str(e)}.")
 
         return v
 
@@ -230,13 +278,15 @@ class DeploymentConfig(BaseModel):
         return _needs_pickle(self.deployment_language, self.is_cross_language)
 
     def to_proto(self):
-        data = self.dict()
-        if data.get("user_config") is not None:
+        # Read the fields directly instead of calling self.dict(), which would
+        # recursively export autoscaling_config only for it to be re-wrapped.
+        data = {name: getattr(self, name) for name in _DEPLOYMENT_CONFIG_FIELDS}
+        if data["user_config"] is not None:
             if self.needs_pickle():
                 data["user_config"] = cloudpickle.dumps(data["user_config"])
-        if data.get("autoscaling_config"):
+        if data["autoscaling_config"] is not None:
             data["autoscaling_config"] = AutoscalingConfigProto(
-                **data["autoscaling_config"]
+                **data["autoscaling_config"].dict()
             )
         data["user_configured_option_names"] = list(
             data["user_configured_option_names"]
@@ -247,46 +297,57 @@ class DeploymentConfig(BaseModel):
         return self.to_proto().SerializeToString()
 
     @classmethod
-    def from_proto(cls, proto: DeploymentConfigProto):
-        data = MessageToDict(
-            proto,
-            including_default_value_fields=True,
-            preserving_proto_field_name=True,
-            use_integers_for_enums=True,
-        )
-        if "user_config" in data:
-            if data["user_config"] != "":
-                deployment_language = (
-                    data["deployment_language"]
-                    if "deployment_language" in data
-                    else DeploymentLanguage.PYTHON
-                )
-                is_cross_language = (
-                    data["is_cross_language"] if "is_cross_language" in data else False
-                )
-                needs_pickle = _needs_pickle(deployment_language, is_cross_language)
-                if needs_pickle:
-                    data["user_config"] = cloudpickle.loads(proto.user_config)
-                else:
-                    # after MessageToDict, bytes data has been deal with base64
-                    data["user_config"] = proto.user_config
+    def from_proto(cls, proto: DeploymentConfigProto, validate: bool = True):
+        """Create a DeploymentConfig from its proto.
+
+        Args:
+            proto: The proto to read the config from.
+            validate: Whether to run the field validators. Only skip this for
+                protos produced by `to_proto()` from an already-validated
+                config; protos from other clients (e.g. Java) must be validated.
+        """
+        # Read fields directly off the proto rather than going through
+        # MessageToDict, which reflectively converts every field.
+        data = {
+            "num_replicas": proto.num_replicas,
+            "max_concurrent_queries": proto.max_concurrent_queries,
+            "user_config": None,
+            "graceful_shutdown_wait_loop_s": proto.graceful_shutdown_wait_loop_s,
+            "graceful_shutdown_timeout_s": proto.graceful_shutdown_timeout_s,
+            "health_check_period_s": proto.health_check_period_s,
+            "health_check_timeout_s": proto.health_check_timeout_s,
+            "is_cross_language": proto.is_cross_language,
+            "deployment_language": proto.deployment_language,
+            "version": proto.version if proto.version != "" else None,
+            "user_configured_option_names": set(proto.user_configured_option_names),
+        }
+        if proto.user_config != b"":
+            if _needs_pickle(proto.deployment_language, proto.is_cross_language):
+                data["user_config"] = cloudpickle.loads(proto.user_config)
             else:
-                data["user_config"] = None
-        if "autoscaling_config" in data:
-            data["autoscaling_config"] = AutoscalingConfig(**data["autoscaling_config"])
-        if "version" in data:
-            if data["version"] == "":
-                data["version"] = None
-        if "user_configured_option_names" in data:
-            data["user_configured_option_names"] = set(
-                data["user_configured_option_names"]
-            )
-        return cls(**data)
+                data["user_config"] = proto.user_config
+        if proto.HasField("autoscaling_config"):
+            autoscaling_proto = proto.autoscaling_config
+            autoscaling_data = {
+                name: getattr(autoscaling_proto, name)
+                for name in AutoscalingConfig.__fields__
+            }
+            if not autoscaling_proto.HasField("initial_replicas"):
+                autoscaling_data["initial_replicas"] = None
+            if validate:
+                data["autoscaling_config"] = AutoscalingConfig(**autoscaling_data)
+            else:
+                data["autoscaling_config"] = AutoscalingConfig.construct(
+                    **autoscaling_data
+                )
+        if validate:
+            return cls(**data)
+        return cls.construct(**data)
 
     @classmethod
-    def from_proto_bytes(cls, proto_bytes: bytes):
+    def from_proto_bytes(cls, proto_bytes: bytes, validate: bool = True):
         proto = DeploymentConfigProto.FromString(proto_bytes)
-        return cls.from_proto(proto)
+        return cls.from_proto(proto, validate=validate)
 
     @classmethod
     def from_default(cls, **kwargs):
@@ -299,25 +360,24 @@ class DeploymentConfig(BaseModel):
                 passed in.
         """
 
-        config = cls()
-        valid_config_options = set(config.dict().keys())
-
         # Friendly error if a non-DeploymentConfig kwarg was passed in
-        for key, val in kwargs.items():
-            if key not in valid_config_options:
-                raise TypeError(
-                    f'Got invalid Deployment config option "{key}" '
-                    f"(with value {val}) as keyword argument. All Deployment "
-                    "config options must come from this list: "
-                    f"{list(valid_config_options)}."
-                )
+        invalid_options = kwargs.keys() - _DEPLOYMENT_CONFIG_FIELDS
+        if invalid_options:
+            key = next(key for key in kwargs if key in invalid_options)
+            raise TypeError(
+                f'Got invalid Deployment config option "{key}" '
+                f"(with value {kwargs[key]}) as keyword argument. All Deployment "
+                "config options must come from this list: "
+                f"{list(_DEPLOYMENT_CONFIG_FIELDS)}."
+            )
 
-        kwargs = {key: val for key, val in kwargs.items() if val != DEFAULT.VALUE}
+        # Construct the config in a single validation pass rather than creating
+        # a default config and re-validating it on every assignment.
+        return cls(**{key: val for key, val in kwargs.items() if val != DEFAULT.VALUE})
 
-        for key, val in kwargs.items():
-            config.__setattr__(key, val)
 
-        return config
+# Names of all DeploymentConfig fields, computed once at import time.
+_DEPLOYMENT_CONFIG_FIELDS = frozenset(DeploymentConfig.__fields__.keys())
 
 
 @DeveloperAPI
@@ -421,7 +481,7 @@ class ReplicaConfig:
             elif init_kwargs:
                 raise ValueError("init_kwargs not supported for function deployments.")
 
-        if not isinstance(deployment_def, (Callable, str)):
+        if not (callable(deployment_def) or isinstance(deployment_def, str)):
             raise TypeError(
                 f'Got invalid type "{type(deployment_def)}" for '
                 "deployment_def. Expected deployment_def to be a "
@@ -465,25 +525,11 @@ class ReplicaConfig:
                 f'Got invalid type "{type(self.ray_actor_options)}" for '
                 "ray_actor_options. Expected a dictionary."
             )
-        # Please keep this in sync with the docstring for the ray_actor_options
-        # kwarg in api.py.
-        allowed_ray_actor_options = {
-            # Resource options
-            "accelerator_type",
-            "memory",
-            "num_cpus",
-            "num_gpus",
-            "object_store_memory",
-            "resources",
-            # Other options
-            "runtime_env",
-        }
-
         for option in self.ray_actor_options:
-            if option not in allowed_ray_actor_options:
+            if option not in _ALLOWED_RAY_ACTOR_OPTIONS:
                 raise ValueError(
                     f"Specifying '{option}' in ray_actor_options is not allowed. "
-                    f"Allowed options: {allowed_ray_actor_options}"
+                    f"Allowed options: {set(_ALLOWED_RAY_ACTOR_OPTIONS)}"
                 )
         ray_option_utils.validate_actor_options(self.ray_actor_options, in_options=True)
 
@@ -520,11 +566,10 @@ class ReplicaConfig:
                     'dictionaries. For example: `[{"CPU": 1.0}, {"GPU": 1.0}]`.'
                 )
 
-            for i, bundle in enumerate(self.placement_group_bundles):
-                if (
-                    not isinstance(bundle, dict)
-                    or not all(isinstance(k, str) for k in bundle.keys())
-                    or not all(isinstance(v, (int, float)) for v in bundle.values())
+            for bundle in self.placement_group_bundles:
+                if not isinstance(bundle, dict) or not all(
+                    isinstance(k, str) and isinstance(v, (int, float))
+                    for k, v in bundle.items()
                 ):
                     raise ValueError(
                         "`placement_group_bundles` must be a non-empty list of "
@@ -532,46 +577,46 @@ class ReplicaConfig:
                         '`[{"CPU": 1.0}, {"GPU": 1.0}]`.'
                     )
 
-                # Validate that the replica actor fits in the first bundle.
-                if i == 0:
-                    bundle_cpu = bundle.get("CPU", 0)
-                    replica_actor_num_cpus = self.ray_actor_options.get("num_cpus", 0)
-                    if bundle_cpu < replica_actor_num_cpus:
-                        raise ValueError(
-                            "When using `placement_group_bundles`, the replica actor "
-                            "will be placed in the first bundle, so the resource "
-                            "requirements for the actor must be a subset of the first "
-                            "bundle. `num_cpus` for the actor is "
-                            f"{replica_actor_num_cpus} but the bundle only has "
-                            f"{bundle_cpu} `CPU` specified."
-                        )
-
-                    bundle_gpu = bundle.get("GPU", 0)
-                    replica_actor_num_gpus = self.ray_actor_options.get("num_gpus", 0)
-                    if bundle_gpu < replica_actor_num_gpus:
-                        raise ValueError(
-                            "When using `placement_group_bundles`, the replica actor "
-                            "will be placed in the first bundle, so the resource "
-                            "requirements for the actor must be a subset of the first "
-                            "bundle. `num_gpus` for the actor is "
-                            f"{replica_actor_num_gpus} but the bundle only has "
-                            f"{bundle_gpu} `GPU` specified."
-                        )
-
-                    replica_actor_resources = self.ray_actor_options.get(
-                        "resources", {}
+            # Validate that the replica actor fits in the first bundle.
+            first_bundle = self.placement_group_bundles[0]
+            ray_actor_options = self.ray_actor_options
+            replica_actor_num_cpus = ray_actor_options.get("num_cpus", 0)
+            replica_actor_num_gpus = ray_actor_options.get("num_gpus", 0)
+            replica_actor_resources = ray_actor_options.get("resources", {})
+
+            bundle_cpu = first_bundle.get("CPU", 0)
+            if bundle_cpu < replica_actor_num_cpus:
+                raise ValueError(
+                    "When using `placement_group_bundles`, the replica actor "
+                    "will be placed in the first bundle, so the resource "
+                    "requirements for the actor must be a subset of the first "
+                    "bundle. `num_cpus` for the actor is "
+                    f"{replica_actor_num_cpus} but the bundle only has "
+                    f"{bundle_cpu} `CPU` specified."
+                )
+
+            bundle_gpu = first_bundle.get("GPU", 0)
+            if bundle_gpu < replica_actor_num_gpus:
+                raise ValueError(
+                    "When using `placement_group_bundles`, the replica actor "
+                    "will be placed in the first bundle, so the resource "
+                    "requirements for the actor must be a subset of the first "
+                    "bundle. `num_gpus` for the actor is "
+                    f"{replica_actor_num_gpus} but the bundle only has "
+                    f"{bundle_gpu} `GPU` specified."
+                )
+
+            for actor_resource, actor_value in replica_actor_resources.items():
+                bundle_value = first_bundle.get(actor_resource, 0)
+                if bundle_value < actor_value:
+                    raise ValueError(
+                        "When using `placement_group_bundles`, the replica "
+                        "actor will be placed in the first bundle, so the "
+                        "resource requirements for the actor must be a subset "
+                        f"of the first bundle. `{actor_resource}` requirement "
+                        f"for the actor is {actor_value} but the bundle only "
+                        f"has {bundle_value} `{actor_resource}` specified."
                     )
-                    for actor_resource, actor_value in replica_actor_resources.items():
-                        bundle_value = bundle.get(actor_resource, 0)
-                        if bundle_value < actor_value:
-                            raise ValueError(
-                                "When using `placement_group_bundles`, the replica "
-                                "actor will be placed in the first bundle, so the "
-                                "resource requirements for the actor must be a subset "
-                                f"of the first bundle. `{actor_resource}` requirement "
-                                f"for the actor is {actor_value} but the bundle only "
-                                f"has {bundle_value} `{actor_resource}` specified."
-                            )
 
     @property
     def deployment_def(self) -> Union[Callable, str]:
@@ -611,7 +656,7 @@ class ReplicaConfig:
         return self._init_args
 
     @property
-    def init_kwargs(self) -> Optional[Tuple[Any]]:
+    def init_kwargs(self) -> Optional[Union[Dict[Any, Any], bytes]]:
         """The init_kwargs for a Python class.
 
         This property is only meaningful if deployment_def is a Python class.
@@ -619,7 +664,10 @@ class ReplicaConfig:
         """
 
         if self._init_kwargs is None:
-            self._init_kwargs = cloudpickle.loads(self.serialized_init_kwargs)
+            if self.needs_pickle:
+                self._init_kwargs = cloudpickle.loads(self.serialized_init_kwargs)
+            else:
+                self._init_kwargs = self.serialized_init_kwargs
 
         return self._init_kwargs
 
@@ -630,8 +678,8 @@ class ReplicaConfig:
             proto.deployment_def,
             proto.init_args if proto.init_args != b"" else None,
             proto.init_kwargs if proto.init_kwargs != b"" else None,
-            json.loads(proto.ray_actor_options),
-            json.loads(proto.placement_group_bundles)
+            _json_loads(proto.ray_actor_options),
+            _json_loads(proto.placement_group_bundles)
             if proto.placement_group_bundles
             else None,
             proto.placement_group_strategy
@@ -651,8 +699,8 @@ class ReplicaConfig:
             deployment_def=self.serialized_deployment_def,
             init_args=self.serialized_init_args,
             init_kwargs=self.serialized_init_kwargs,
-            ray_actor_options=json.dumps(self.ray_actor_options),
-            placement_group_bundles=json.dumps(self.placement_group_bundles)
+            ray_actor_options=_json_dumps(self.ray_actor_options),
+            placement_group_bundles=_json_dumps(self.placement_group_bundles)
             if self.placement_group_bundles is not None
             else "",
             placement_group_strategy=self.placement_group_strategy,
@@ -676,7 +724,7 @@ class HTTPOptions(pydantic.BaseModel):
     # Documentation inside serve.start for user's convenience.
     host: Optional[str] = DEFAULT_HTTP_HOST
     port: int = DEFAULT_HTTP_PORT
-    middlewares: List[Any] = []
+    middlewares: Tuple[Any, ...] = ()
     location: Optional[DeploymentMode] = DeploymentMode.HeadOnly
     num_cpus: int = 0
     root_url: str = ""
@@ -707,6 +755,15 @@ class HTTPOptions(pydantic.BaseModel):
         arbitrary_types_allowed = True
 
 
+@lru_cache(maxsize=None)
+def _import_grpc_servicer_func(func: str) -> Any:
+    """Import a gRPC servicer function, caching successful imports by path.
+
+    Failed imports raise and are not cached, so they are retried on next access.
+    """
+    return import_attr(func)
+
+
 @PublicAPI(stability="beta")
 class gRPCOptions(BaseModel):
     """Configuration options for gRPC proxy.
@@ -716,15 +773,15 @@ class gRPCOptions(BaseModel):
             Port for gRPC server if started. Default to 9000. Cannot be
             updated once Serve has started running. Serve must be shut down and
             restarted with the new port instead.
-        grpc_servicer_functions (List[str]):
+        grpc_servicer_functions (Tuple[str, ...]):
             The servicer functions used to add the method handlers to the gRPC server.
-            Default to empty list, which means no gRPC methods will be added
+            Default to empty, which means no gRPC methods will be added
             and no gRPC server will be started. The servicer functions need to be
             importable from the context of where Serve is running.
     """
 
     port: int = DEFAULT_GRPC_PORT
-    grpc_servicer_functions: List[str] = []
+    grpc_servicer_functions: Tuple[str, ...] = ()
 
     @property
     def grpc_servicer_func_callable(self) -> List[Callable]:
@@ -736,7 +793,7 @@ class gRPCOptions(BaseModel):
         callables = []
         for func in self.grpc_servicer_functions:
             try:
-                imported_func = import_attr(func)
+                imported_func = _import_grpc_servicer_func(func)
                 if callable(imported_func):
                     callables.append(imported_func)
                 else:
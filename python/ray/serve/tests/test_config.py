@@ -342,6 +342,40 @@ class TestReplicaConfig:
         assert config.init_args == tuple()
         assert config.init_kwargs == dict()
 
+    def test_replica_config_proto_roundtrip(self):
+        class Class:
+            pass
+
+        config = ReplicaConfig.create(
+            Class,
+            ray_actor_options={
+                "num_cpus": 0.5,
+                "resources": {"custom": 1},
+                "runtime_env": {"env_vars": {"KEY": "VALUE"}},
+            },
+            placement_group_bundles=[{"CPU": 1.0, "custom": 1}],
+            placement_group_strategy="STRICT_PACK",
+        )
+        deserialized = ReplicaConfig.from_proto_bytes(config.to_proto_bytes())
+
+        assert deserialized.ray_actor_options == config.ray_actor_options
+        assert deserialized.placement_group_bundles == config.placement_group_bundles
+        assert deserialized.placement_group_strategy == config.placement_group_strategy
+
+    def test_replica_config_no_pickle(self):
+        config = ReplicaConfig(
+            "io.ray.serve.MyClass",
+            b"io.ray.serve.MyClass",
+            b"init_args",
+            b"init_kwargs",
+            {},
+            needs_pickle=False,
+        )
+
+        assert config.deployment_def == "io.ray.serve.MyClass"
+        assert config.init_args == b"init_args"
+        assert config.init_kwargs == b"init_kwargs"
+
 
 def test_http_options():
     HTTPOptions()
@@ -360,6 +394,41 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    # Test autoscaling_config, version, and user_configured_option_names
+    for initial_replicas in [None, 0, 2]:
+        config = DeploymentConfig(
+            autoscaling_config={
+                "min_replicas": 0,
+                "initial_replicas": initial_replicas,
+                "max_replicas": 5,
+            },
+            version="abc",
+            user_configured_option_names={"autoscaling_config", "version"},
+        )
+        assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
+
+def test_from_proto_validation():
+    # Protos can come from other clients (e.g. Java), so they're validated by
+    # default.
+    proto = DeploymentConfig().to_proto()
+    proto.max_concurrent_queries = 0
+    with pytest.raises(ValidationError):
+        DeploymentConfig.from_proto_bytes(proto.SerializeToString())
+
+    proto = DeploymentConfig(
+        autoscaling_config={"min_replicas": 1, "max_replicas": 2}
+    ).to_proto()
+    proto.autoscaling_config.min_replicas = 3
+    with pytest.raises(ValidationError):
+        DeploymentConfig.from_proto(proto)
+
+    # Internal callers can skip validation for already-validated configs.
+    config = DeploymentConfig(num_replicas=3, max_concurrent_queries=16)
+    assert config == DeploymentConfig.from_proto_bytes(
+        config.to_proto_bytes(), validate=False
+    )
+
 
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
@@ -392,7 +461,7 @@ def test_grpc_options():
     """
     default_grpc_options = gRPCOptions()
     assert default_grpc_options.port == DEFAULT_GRPC_PORT
-    assert default_grpc_options.grpc_servicer_functions == []
+    assert default_grpc_options.grpc_servicer_functions == ()
     assert default_grpc_options.grpc_servicer_func_callable == []
 
     port = 9001
@@ -406,7 +475,7 @@ def test_grpc_options():
         grpc_servicer_functions=grpc_servicer_functions,
     )
     assert grpc_options.port == port
-    assert grpc_options.grpc_servicer_functions == grpc_servicer_functions
+    assert grpc_options.grpc_servicer_functions == tuple(grpc_servicer_functions)
     assert grpc_options.grpc_servicer_func_callable == [
         add_UserDefinedServiceServicer_to_server
     ]
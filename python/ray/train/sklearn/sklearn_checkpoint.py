@@ -1,7 +1,15 @@
+import asyncio
+import contextlib
+import functools
+import io
+import mmap
 import os
 import tempfile
-from typing import TYPE_CHECKING, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
+import joblib
+import pyarrow.fs
 from sklearn.base import BaseEstimator
 from ray.air._internal.checkpointing import save_preprocessor_to_dir
 from ray.air.checkpoint import Checkpoint
@@ -13,12 +21,139 @@ from ray.util.annotations import PublicAPI
 if TYPE_CHECKING:
     from ray.data.preprocessor import Preprocessor
 
+# Buffer size used when reading and writing pickled estimators. Pickling a large
+# estimator issues many small writes, so a large buffer coalesces them into fewer
+# system calls.
+_MODEL_IO_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+# Magic bytes at the start of zstd and LZ4 frames. Neither is a valid start of a
+# pickle stream, so they identify compressed model files on read.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_LZ4_MAGIC = b"\x04\x22\x4d\x18"
+
+_SUPPORTED_COMPRESSIONS = ("zstd", "lz4")
+
+
+def _import_compression_module(compression: str):
+    try:
+        if compression == "zstd":
+            import zstandard
+
+            return zstandard
+        else:
+            import lz4.frame
+
+            return lz4.frame
+    except ImportError:
+        package = "zstandard" if compression == "zstd" else "lz4"
+        raise ImportError(
+            f"`compression={compression!r}` requires the `{package}` package. "
+            f"Please install with: `pip install {package}`"
+        ) from None
+
+
+@contextlib.contextmanager
+def _atomic_write_path(path: str) -> Iterator[str]:
+    """Yield a temporary path to write to, then move it to ``path``.
+
+    Readers never observe a partially written model file.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _validate_compression(compression: Optional[str]) -> None:
+    if compression is not None and compression not in _SUPPORTED_COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression {compression!r}. Supported compressions "
+            f"are: {_SUPPORTED_COMPRESSIONS}."
+        )
+
+
+def _save_estimator(
+    estimator: BaseEstimator, path: str, compression: Optional[str] = None
+) -> None:
+    with _atomic_write_path(path) as tmp_path, open(
+        tmp_path, "wb", buffering=_MODEL_IO_BUFFER_SIZE
+    ) as f:
+        if compression == "zstd":
+            zstandard = _import_compression_module(compression)
+            compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+            with compressor.stream_writer(f) as stream:
+                cpickle.dump(estimator, stream)
+        elif compression == "lz4":
+            lz4_frame = _import_compression_module(compression)
+            with lz4_frame.open(f, mode="wb") as stream:
+                cpickle.dump(estimator, stream)
+        else:
+            cpickle.dump(estimator, f)
+
+
+def _load_compressed_estimator(f, magic: bytes) -> BaseEstimator:
+    if magic == _ZSTD_MAGIC:
+        zstandard = _import_compression_module("zstd")
+        with zstandard.ZstdDecompressor().stream_reader(f) as stream:
+            return cpickle.load(stream)
+    else:
+        lz4_frame = _import_compression_module("lz4")
+        with lz4_frame.open(f, mode="rb") as stream:
+            return cpickle.load(stream)
+
+
+def _load_estimator(path: str) -> BaseEstimator:
+    # Open unbuffered: the uncompressed path reads the file only through the
+    # mapping, and a buffered reader would read ahead a full buffer first.
+    with open(path, "rb", buffering=0) as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and file objects that can't be mapped.
+            return _load_estimator_from_file(
+                io.BufferedReader(f, buffer_size=_MODEL_IO_BUFFER_SIZE)
+            )
+
+        with mm:
+            magic = mm[:4]
+            if magic not in (_ZSTD_MAGIC, _LZ4_MAGIC):
+                # Unpickle straight from the page cache instead of copying the
+                # file through a buffered reader first.
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return cpickle.loads(mm)
+
+        return _load_compressed_estimator(
+            io.BufferedReader(f, buffer_size=_MODEL_IO_BUFFER_SIZE), magic
+        )
+
+
+def _load_estimator_from_file(f) -> BaseEstimator:
+    # ``f`` must be seekable, so the magic bytes can be read and rewound.
+    magic = f.read(4)
+    f.seek(0)
+    if magic in (_ZSTD_MAGIC, _LZ4_MAGIC):
+        return _load_compressed_estimator(f, magic)
+    return cpickle.load(f)
+
+
+def _load_joblib_estimator(path: str) -> BaseEstimator:
+    # Arrays are memory-mapped read-only rather than copied into memory, so
+    # processes on the same node share the pages of the model file.
+    return joblib.load(path, mmap_mode="r")
+
 
 @PublicAPI(stability="alpha")
 class SklearnCheckpoint(FrameworkCheckpoint):
     """A :py:class:`~ray.train.Checkpoint` with sklearn-specific functionality."""
 
     MODEL_FILENAME = "model.pkl"
+    JOBLIB_MODEL_FILENAME = "model.joblib"
 
     @classmethod
     def from_estimator(
@@ -27,6 +162,8 @@ class SklearnCheckpoint(FrameworkCheckpoint):
         *,
         path: Union[str, os.PathLike] = None,
         preprocessor: Optional["Preprocessor"] = None,
+        compression: Optional[str] = None,
+        serializer: str = "cloudpickle",
     ) -> "SklearnCheckpoint":
         """Create a :py:class:`~ray.train.Checkpoint` that stores an sklearn
         ``Estimator``.
@@ -36,6 +173,16 @@ class SklearnCheckpoint(FrameworkCheckpoint):
             path: The directory where the checkpoint will be stored.
                 Defaults to a temporary directory.
             preprocessor: A fitted preprocessor to be applied before inference.
+            compression: Compress the pickled ``Estimator`` with ``"zstd"``
+                (requires ``zstandard``) or ``"lz4"`` (requires ``lz4``).
+                Defaults to no compression. Compressed checkpoints are detected
+                automatically by :meth:`get_estimator`.
+            serializer: Either ``"cloudpickle"`` (default) or ``"joblib"``. With
+                ``"joblib"``, the ``Estimator``'s arrays are memory-mapped
+                read-only when loaded instead of copied into memory. Unlike
+                cloudpickle, joblib can't serialize classes defined in
+                ``__main__`` by value, and it can't be combined with
+                ``compression``.
 
         Returns:
             An :py:class:`SklearnCheckpoint` containing the specified ``Estimator``.
@@ -47,10 +194,35 @@ class SklearnCheckpoint(FrameworkCheckpoint):
             >>> estimator = RandomForestClassifier()
             >>> checkpoint = SklearnCheckpoint.from_estimator(estimator, path=".")
         """
+        if serializer not in ("cloudpickle", "joblib"):
+            raise ValueError(
+                f"Unsupported serializer {serializer!r}. Supported serializers "
+                "are: ('cloudpickle', 'joblib')."
+            )
+        if serializer == "joblib" and compression is not None:
+            raise ValueError(
+                "`compression` is not supported with `serializer='joblib'`, "
+                "which stores arrays uncompressed so that they can be "
+                "memory-mapped on load."
+            )
+        _validate_compression(compression)
+
         path = path or tempfile.mkdtemp()
 
-        with open(os.path.join(path, cls.MODEL_FILENAME), "wb") as f:
-            cpickle.dump(estimator, f)
+        model_path = os.path.join(path, cls.MODEL_FILENAME)
+        joblib_model_path = os.path.join(path, cls.JOBLIB_MODEL_FILENAME)
+        if serializer == "joblib":
+            with _atomic_write_path(joblib_model_path) as tmp_path:
+                joblib.dump(estimator, tmp_path)
+            stale_model_path = model_path
+        else:
+            _save_estimator(estimator, model_path, compression=compression)
+            stale_model_path = joblib_model_path
+
+        # Remove a model previously written to ``path`` in the other format, so
+        # that ``get_estimator`` can't pick it up instead.
+        if os.path.exists(stale_model_path):
+            os.remove(stale_model_path)
 
         checkpoint = cls.from_directory(path)
         if preprocessor:
@@ -58,12 +230,85 @@ class SklearnCheckpoint(FrameworkCheckpoint):
 
         return checkpoint
 
+    @classmethod
+    async def afrom_estimator(
+        cls,
+        estimator: BaseEstimator,
+        *,
+        path: Union[str, os.PathLike] = None,
+        preprocessor: Optional["Preprocessor"] = None,
+        compression: Optional[str] = None,
+        serializer: str = "cloudpickle",
+    ) -> "SklearnCheckpoint":
+        """Async version of :meth:`from_estimator`.
+
+        Serializes the ``Estimator`` in the event loop's default executor so that
+        large models don't block the event loop, e.g. in async actors.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                cls.from_estimator,
+                estimator,
+                path=path,
+                preprocessor=preprocessor,
+                compression=compression,
+                serializer=serializer,
+            ),
+        )
+
     def get_estimator(self) -> BaseEstimator:
         """Retrieve the ``Estimator`` stored in this checkpoint."""
-        with self.as_directory() as checkpoint_path:
-            estimator_path = os.path.join(checkpoint_path, self.MODEL_FILENAME)
-            with open(estimator_path, "rb") as f:
-                return cpickle.load(f)
+        model_path = os.path.join(self.path, self.MODEL_FILENAME)
+        joblib_model_path = os.path.join(self.path, self.JOBLIB_MODEL_FILENAME)
+        if isinstance(self.filesystem, pyarrow.fs.LocalFileSystem):
+            if not os.path.exists(model_path) and os.path.exists(joblib_model_path):
+                return _load_joblib_estimator(joblib_model_path)
+            return _load_estimator(model_path)
+
+        # Stream only the model file rather than downloading the whole checkpoint
+        # directory. Both possible model files are looked up in a single call.
+        model_info, joblib_model_info = self.filesystem.get_file_info(
+            [model_path, joblib_model_path]
+        )
+        if (
+            model_info.type == pyarrow.fs.FileType.NotFound
+            and joblib_model_info.type != pyarrow.fs.FileType.NotFound
+        ):
+            with self.filesystem.open_input_file(joblib_model_path) as f:
+                return joblib.load(f)
+        with self.filesystem.open_input_file(model_path) as f:
+            return _load_estimator_from_file(f)
+
+    @classmethod
+    def load_many(
+        cls,
+        checkpoints: List["SklearnCheckpoint"],
+        max_workers: Optional[int] = None,
+    ) -> List[BaseEstimator]:
+        """Retrieve the ``Estimator`` of each checkpoint, loading them concurrently.
+
+        Args:
+            checkpoints: The checkpoints to load ``Estimator`` objects from.
+            max_workers: The maximum number of threads to load with. Defaults to
+                ``min(len(checkpoints), os.cpu_count())``.
+
+        Returns:
+            The ``Estimator`` of each checkpoint, in the same order as
+            ``checkpoints``.
+        """
+        if not checkpoints:
+            return []
+        if max_workers is None:
+            max_workers = min(len(checkpoints), os.cpu_count() or 1)
+
+        # Threads rather than processes: reads from storage release the GIL, and
+        # estimators loaded in another process would have to be pickled back.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda checkpoint: checkpoint.get_estimator(), checkpoints)
+            )
 
 
 @PublicAPI(stability="alpha")
@@ -108,8 +353,7 @@ class LegacySklearnCheckpoint(Checkpoint):
             >>>
             >>> predictor = SklearnPredictor.from_checkpoint(checkpoint)
         """
-        with open(os.path.join(path, MODEL_KEY), "wb") as f:
-            cpickle.dump(estimator, f)
+        _save_estimator(estimator, os.path.join(path, MODEL_KEY))
 
         if preprocessor:
             save_preprocessor_to_dir(preprocessor, path)
@@ -121,6 +365,4 @@ class LegacySklearnCheckpoint(Checkpoint):
     def get_estimator(self) -> BaseEstimator:
         """Retrieve the ``Estimator`` stored in this checkpoint."""
         with self.as_directory() as checkpoint_path:
-            estimator_path = os.path.join(checkpoint_path, MODEL_KEY)
-            with open(estimator_path, "rb") as f:
-                return cpickle.load(f)
+            return _load_estimator(os.path.join(checkpoint_path, MODEL_KEY))
@@ -1,9 +1,12 @@
+import asyncio
 import os
 import re
 import tempfile
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow.fs
 import pytest
 from ray.air.util.data_batch_conversion import _convert_pandas_to_batch_type
 from ray.train.predictor import TYPE_TO_ENUM
@@ -12,8 +15,13 @@ from sklearn.ensemble import RandomForestClassifier
 import ray.cloudpickle as cpickle
 from ray.train import Checkpoint
 from ray.air.constants import MAX_REPR_LENGTH, MODEL_KEY
-from ray.train.sklearn import SklearnCheckpoint, SklearnPredictor
+from ray.train.sklearn import (
+    LegacySklearnCheckpoint,
+    SklearnCheckpoint,
+    SklearnPredictor,
+)
 
+from ray.train.sklearn.sklearn_checkpoint import _LZ4_MAGIC, _ZSTD_MAGIC
 from ray.train.tests.dummy_preprocessor import DummyPreprocessor
 
 
@@ -48,6 +56,146 @@ def test_sklearn_checkpoint(tmp_path):
     assert checkpoint.get_preprocessor() == preprocessor
 
 
+def test_sklearn_checkpoint_get_estimator_returns_fresh_object(tmp_path):
+    checkpoint = SklearnCheckpoint.from_estimator(estimator=model, path=str(tmp_path))
+
+    estimator = checkpoint.get_estimator()
+    estimator.set_params(n_jobs=3)
+    other = checkpoint.get_estimator()
+    assert other is not estimator
+    assert other.n_jobs == model.n_jobs
+
+
+def test_sklearn_checkpoint_estimator_not_shared(tmp_path):
+    SklearnCheckpoint.from_estimator(estimator=model, path=str(tmp_path))
+
+    # Checkpoints of the same model file don't share a mutable estimator.
+    estimator = SklearnCheckpoint.from_directory(str(tmp_path)).get_estimator()
+    estimator.set_params(n_jobs=3)
+    other = SklearnCheckpoint.from_directory(str(tmp_path)).get_estimator()
+    assert other is not estimator
+    assert other.n_jobs == model.n_jobs
+
+
+def test_sklearn_checkpoint_afrom_estimator(tmp_path):
+    checkpoint = asyncio.run(
+        SklearnCheckpoint.afrom_estimator(estimator=model, path=str(tmp_path))
+    )
+
+    assert np.allclose(
+        checkpoint.get_estimator().feature_importances_,
+        model.feature_importances_,
+    )
+
+
+def test_sklearn_checkpoint_load_many(tmp_path):
+    checkpoints = []
+    for i in range(3):
+        path = tmp_path / str(i)
+        path.mkdir()
+        checkpoints.append(
+            SklearnCheckpoint.from_estimator(estimator=model, path=str(path))
+        )
+
+    estimators = SklearnCheckpoint.load_many(checkpoints)
+
+    assert len(estimators) == 3
+    for estimator in estimators:
+        assert np.allclose(estimator.feature_importances_, model.feature_importances_)
+    assert SklearnCheckpoint.load_many([]) == []
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+def test_sklearn_checkpoint_compression(tmp_path, compression):
+    pytest.importorskip("zstandard" if compression == "zstd" else "lz4")
+
+    checkpoint = SklearnCheckpoint.from_estimator(
+        estimator=model, path=str(tmp_path), compression=compression
+    )
+
+    with open(tmp_path / SklearnCheckpoint.MODEL_FILENAME, "rb") as f:
+        assert f.read(4) == (_ZSTD_MAGIC if compression == "zstd" else _LZ4_MAGIC)
+
+    assert np.allclose(
+        checkpoint.get_estimator().feature_importances_,
+        model.feature_importances_,
+    )
+
+
+@pytest.mark.parametrize("serializer", ["cloudpickle", "joblib"])
+def test_sklearn_checkpoint_remote_filesystem(tmp_path, serializer):
+    SklearnCheckpoint.from_estimator(
+        estimator=model, path=str(tmp_path), serializer=serializer
+    )
+
+    # A non-local filesystem, so the model file is read through the filesystem.
+    fs = pyarrow.fs.SubTreeFileSystem(
+        str(tmp_path.parent), pyarrow.fs.LocalFileSystem()
+    )
+    checkpoint = SklearnCheckpoint(path=tmp_path.name, filesystem=fs)
+
+    assert np.allclose(
+        checkpoint.get_estimator().feature_importances_,
+        model.feature_importances_,
+    )
+
+
+def test_sklearn_checkpoint_joblib(tmp_path):
+    checkpoint = SklearnCheckpoint.from_estimator(
+        estimator=model, path=str(tmp_path), serializer="joblib"
+    )
+
+    assert (tmp_path / SklearnCheckpoint.JOBLIB_MODEL_FILENAME).exists()
+    assert not (tmp_path / SklearnCheckpoint.MODEL_FILENAME).exists()
+    assert np.allclose(
+        checkpoint.get_estimator().feature_importances_,
+        model.feature_importances_,
+    )
+
+    with pytest.raises(ValueError):
+        SklearnCheckpoint.from_estimator(
+            estimator=model, serializer="joblib", compression="zstd"
+        )
+
+
+@pytest.mark.parametrize(
+    "serializers", [("joblib", "cloudpickle"), ("cloudpickle", "joblib")]
+)
+def test_sklearn_checkpoint_overwrite_serializer(tmp_path, serializers):
+    first_serializer, second_serializer = serializers
+    other_model = RandomForestClassifier(n_estimators=5, random_state=0).fit(
+        dummy_data, dummy_target
+    )
+
+    SklearnCheckpoint.from_estimator(
+        estimator=model, path=str(tmp_path), serializer=first_serializer
+    )
+    checkpoint = SklearnCheckpoint.from_estimator(
+        estimator=other_model, path=str(tmp_path), serializer=second_serializer
+    )
+
+    assert checkpoint.get_estimator().n_estimators == 5
+    stale_filename = (
+        SklearnCheckpoint.MODEL_FILENAME
+        if second_serializer == "joblib"
+        else SklearnCheckpoint.JOBLIB_MODEL_FILENAME
+    )
+    assert not (tmp_path / stale_filename).exists()
+
+
+def test_sklearn_checkpoint_invalid_compression(tmp_path):
+    with pytest.raises(ValueError):
+        SklearnCheckpoint.from_estimator(
+            estimator=model, path=str(tmp_path), compression="gzip"
+        )
+    assert not any(tmp_path.iterdir())
+
+    # Rejected before a temporary checkpoint directory is created.
+    with patch("tempfile.mkdtemp") as mkdtemp, pytest.raises(ValueError):
+        SklearnCheckpoint.from_estimator(estimator=model, compression="gzip")
+    mkdtemp.assert_not_called()
+
+
 @pytest.mark.parametrize("batch_type", [np.ndarray, pd.DataFrame, dict])
 def test_predict(batch_type):
     preprocessor = DummyPreprocessor()
@@ -73,6 +221,24 @@ def test_predict_set_cpus(ray_start_4_cpus):
     assert predictor.estimator.n_jobs == 2
 
 
+def test_predictors_from_same_checkpoint_dont_share_estimator(
+    ray_start_4_cpus, tmp_path
+):
+    checkpoint = LegacySklearnCheckpoint.from_estimator(model, path=str(tmp_path))
+
+    predictor_1 = SklearnPredictor.from_checkpoint(checkpoint)
+    predictor_2 = SklearnPredictor.from_checkpoint(checkpoint)
+
+    data_batch = np.array([[1, 2], [3, 4], [5, 6]])
+    predictor_1.predict(data_batch, num_estimator_cpus=1)
+    predictor_2.predict(data_batch, num_estimator_cpus=2)
+
+    assert predictor_1.estimator is not predictor_2.estimator
+    assert predictor_1.estimator.n_jobs == 1
+    assert predictor_2.estimator.n_jobs == 2
+    assert checkpoint.get_estimator().n_jobs == model.n_jobs
+
+
 def test_predict_feature_columns():
     preprocessor = DummyPreprocessor()
     predictor = SklearnPredictor(estimator=model, preprocessor=preprocessor)